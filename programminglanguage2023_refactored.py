@@ -1,12 +1,16 @@
-import requests
-from bs4 import BeautifulSoup
-import threading
-import time
-from queue import Queue
-import signal
+import asyncio
+import collections
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import os
+import httpx
+from lxml import etree, html as lxml_html
+import functools
+import hashlib
 import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, List, Optional, Union
 
 # Setup basic logging
 logging.basicConfig(level=logging.INFO)
@@ -15,326 +19,480 @@ logger = logging.getLogger(__name__)
 
 class NewsItem:
     """Simple data class for news items"""
+    # No per-instance __dict__; many items can sit in the queue at once
+    __slots__ = ('name', 'title', 'desc', 'timestamp')
+    
     def __init__(self, name: str, title: str, desc: str, timestamp: str):
         # Input validation - fixes Issue #8
         if not all([name, title, desc, timestamp]):
             raise ValueError("All fields must be non-empty")
-        self.name = name
+        # Only a handful of site names exist; share one string object each
+        self.name = sys.intern(name)
         self.title = title
         self.desc = desc
         self.timestamp = timestamp
+    
+    def __reduce__(self):
+        # Rebuild through __init__ so items coming back from the parser pool are interned too
+        return (NewsItem, (self.name, self.title, self.desc, self.timestamp))
+
+
+class _NotModified:
+    """Type of the NOT_MODIFIED sentinel"""
+    __slots__ = ()
+    
+    def __repr__(self):
+        return "NOT_MODIFIED"
+
+
+# Returned by HTTPClient.fetch when the server answers 304 Not Modified
+NOT_MODIFIED = _NotModified()
 
 
 class HTTPClient:
     """Handles HTTP requests with timeout and retry - fixes Issue #4"""
     
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        # HTTP/2 multiplexes every poll over one kept-alive connection per host
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            # requests followed redirects by default; httpx does not
+            follow_redirects=True,
+            transport=transport,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+            # httpx already sends Accept-Encoding for every codec it can decode
+            # (br only when a brotli package is installed) and decompresses transparently
+            headers={'User-Agent': 'Mozilla/5.0 (compatible; NewsScraping/1.0)'}
+        )
+        # Validators from the last 200 response, sent back as conditional headers
+        self._etag = {}
+        self._last_mod = {}
     
-    def fetch(self, url: str) -> Optional[str]:
-        """Fetch content with timeout and retry logic"""
+    async def fetch(self, url: str) -> Union[bytearray, _NotModified, None]:
+        """Fetch raw content with timeout and retry logic
+        
+        Returns NOT_MODIFIED when the page is unchanged since the last fetch.
+        """
+        headers = {}
+        if url in self._etag:
+            headers['If-None-Match'] = self._etag[url]
+        if url in self._last_mod:
+            headers['If-Modified-Since'] = self._last_mod[url]
+        
         for attempt in range(self.max_retries):
             try:
-                # Add timeout to prevent hanging - fixes Issue #4
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.text
-            except requests.exceptions.Timeout:
+                # Client-wide timeout prevents hanging - fixes Issue #4
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == 304:
+                        return NOT_MODIFIED
+                    response.raise_for_status()
+                    # Raw bytes let lxml detect the document encoding itself;
+                    # streaming into one buffer avoids holding a second copy
+                    content = bytearray()
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        content += chunk
+                    
+                    if 'ETag' in response.headers:
+                        self._etag[url] = response.headers['ETag']
+                    if 'Last-Modified' in response.headers:
+                        self._last_mod[url] = response.headers['Last-Modified']
+                    return content
+            except httpx.TimeoutException:
                 logger.warning(f"Timeout attempt {attempt + 1} for {url}")
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.error(f"Request error for {url}: {e}")
                 break
             
             if attempt < self.max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
         
         return None
     
-    def close(self):
-        """Close session"""
-        self.session.close()
+    def forget(self, url: str):
+        """Drop the saved validators so the next fetch of url downloads the full page"""
+        self._etag.pop(url, None)
+        self._last_mod.pop(url, None)
+    
+    async def close(self):
+        """Close client"""
+        await self.client.aclose()
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one token of the class attribute"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+@functools.lru_cache(maxsize=None)
+def _xpath(expression: str) -> etree.XPath:
+    """Compile an XPath expression once and reuse it for every parse"""
+    return etree.XPath(expression)
 
 
 class NewsParser(ABC):
     """Base parser class - fixes Issue #5 (code duplication)"""
     
+    # Fixed per site; the page <title> can change (interstitials, maintenance pages)
+    site_name = ""
+    
+    def __init__(self):
+        # Leave out nodes the parsers never read so libxml2 builds a smaller tree
+        self._html_parser = lxml_html.HTMLParser(
+            remove_comments=True,
+            remove_pis=True,
+            remove_blank_text=True,
+            collect_ids=False
+        )
+    
     @abstractmethod
-    def parse(self, html_content: str) -> List[NewsItem]:
+    def parse(self, html_content: bytes) -> List[NewsItem]:
         pass
     
+    def first(self, xpath: etree.XPath, node):
+        """Return the first XPath match or None"""
+        matches = xpath(node)
+        return matches[0] if matches else None
+    
     def safe_get_text(self, element) -> str:
         """Safely extract text - fixes Issue #1 (NoneType errors)"""
-        if element is None:
-            return ""
-        return element.get_text(strip=True) if hasattr(element, 'get_text') else str(element)
+        # Strip and join each text node, matching bs4's get_text(strip=True)
+        return "".join(text.strip() for text in element.itertext()) if element is not None else ""
     
     def safe_get_attr(self, element, attr: str) -> str:
         """Safely extract attribute - fixes Issue #1 (NoneType errors)"""
-        if element is None:
-            return ""
-        return element.get(attr, "") if hasattr(element, 'get') else ""
+        return element.get(attr, "") if element is not None else ""
 
 
 class Liputan6Parser(NewsParser):
     """Parser for Liputan6 website"""
     
-    def parse(self, html_content: str) -> List[NewsItem]:
+    site_name = "Liputan6"
+    
+    def __init__(self):
+        super().__init__()
+        self._news_xp = _xpath(f"//div[{_has_class('headline--main__wrapper')}]")
+        # Trailing [1] lets libxml2 stop at the first match inside each wrapper
+        self._title_xp = _xpath(f"(.//h1[{_has_class('headline--main__title')}])[1]")
+        self._desc_xp = _xpath(f"(.//p[{_has_class('headline--main__short-desc')}])[1]")
+        self._time_xp = _xpath(f"(.//time[{_has_class('timeago')}])[1]")
+    
+    def parse(self, html_content: bytes) -> List[NewsItem]:
         news_items = []
         try:
-            soup = BeautifulSoup(html_content, features="html.parser")
-            website_name = self._get_site_name(soup)
+            root = lxml_html.document_fromstring(html_content, parser=self._html_parser)
+            website_name = self.site_name
             
-            for news in soup.find_all('div', class_="headline--main__wrapper"):
-                try:
-                    title_elem = news.find('h1', class_="headline--main__title")
-                    desc_elem = news.find('p', class_="headline--main__short-desc")
-                    time_elem = news.find('time', class_="timeago")
-                    
-                    # Use safe extraction methods - fixes Issue #1
-                    title = self.safe_get_text(title_elem)
-                    desc = self.safe_get_text(desc_elem)
-                    timestamp = self.safe_get_attr(time_elem, "datetime")
-                    
-                    if title and desc and timestamp:
-                        news_items.append(NewsItem(website_name, title, desc, timestamp))
-                except Exception as e:
-                    logger.warning(f"Error parsing news item: {e}")
+            for news in self._news_xp(root):
+                title_elem = self.first(self._title_xp, news)
+                desc_elem = self.first(self._desc_xp, news)
+                time_elem = self.first(self._time_xp, news)
+                if title_elem is None or desc_elem is None or time_elem is None:
                     continue
+                
+                # Use safe extraction methods - fixes Issue #1
+                title = self.safe_get_text(title_elem)
+                desc = self.safe_get_text(desc_elem)
+                timestamp = self.safe_get_attr(time_elem, "datetime")
+                
+                if title and desc and timestamp:
+                    news_items.append(NewsItem(website_name, title, desc, timestamp))
         except Exception as e:
             logger.error(f"Error parsing Liputan6 content: {e}")
         
         return news_items
-    
-    def _get_site_name(self, soup) -> str:
-        try:
-            if soup.head and soup.head.find('title'):
-                return soup.head.find('title').string or "Liputan6"
-        except:
-            pass
-        return "Liputan6"
 
 
 class BisnisParser(NewsParser):
     """Parser for Bisnis website"""
     
-    def parse(self, html_content: str) -> List[NewsItem]:
+    site_name = "Bisnis"
+    
+    def __init__(self):
+        super().__init__()
+        self._news_xp = _xpath("//li[normalize-space(@class)='big style2']")
+        # Nested lookups stay scoped to the first container, like the old find() chain,
+        # and the trailing [1] lets libxml2 stop at the first match
+        self._date_xp = _xpath(f"((.//div[{_has_class('channel')}])[1]//div[{_has_class('date')}])[1]")
+        self._title_xp = _xpath(f"((.//h2)[1]//a[{_has_class('bigteks')}])[1]")
+        self._desc_xp = _xpath(f"(.//div[{_has_class('description')}])[1]")
+    
+    def parse(self, html_content: bytes) -> List[NewsItem]:
         news_items = []
         try:
-            soup = BeautifulSoup(html_content, features="html.parser")
-            website_name = self._get_site_name(soup)
+            root = lxml_html.document_fromstring(html_content, parser=self._html_parser)
+            website_name = self.site_name
             
-            for news in soup.find_all('li', class_="big style2"):
-                try:
-                    # Safe nested element access - fixes Issue #1
-                    channel_elem = news.find('div', class_="channel")
-                    date_elem = channel_elem.find('div', class_="date") if channel_elem else None
-                    
-                    h2_elem = news.find('h2')
-                    title_link = h2_elem.find('a', class_="bigteks") if h2_elem else None
-                    
-                    desc_elem = news.find('div', class_="description")
-                    
-                    # Use safe extraction methods - fixes Issue #1
-                    timestamp = self.safe_get_text(date_elem)
-                    title = self.safe_get_attr(title_link, 'title')
-                    desc = self.safe_get_text(desc_elem)
-                    
-                    if title and desc and timestamp:
-                        news_items.append(NewsItem(website_name, title, desc, timestamp))
-                except Exception as e:
-                    logger.warning(f"Error parsing news item: {e}")
+            for news in self._news_xp(root):
+                date_elem = self.first(self._date_xp, news)
+                title_link = self.first(self._title_xp, news)
+                desc_elem = self.first(self._desc_xp, news)
+                if date_elem is None or title_link is None or desc_elem is None:
                     continue
+                
+                # Use safe extraction methods - fixes Issue #1
+                timestamp = self.safe_get_text(date_elem)
+                title = self.safe_get_attr(title_link, 'title')
+                desc = self.safe_get_text(desc_elem)
+                
+                if title and desc and timestamp:
+                    news_items.append(NewsItem(website_name, title, desc, timestamp))
         except Exception as e:
             logger.error(f"Error parsing Bisnis content: {e}")
         
         return news_items
-    
-    def _get_site_name(self, soup) -> str:
-        try:
-            if soup.head and soup.head.find('title'):
-                return soup.head.find('title').string or "Bisnis"
-        except:
-            pass
-        return "Bisnis"
 
 
 class ABCParser(NewsParser):
     """Parser for ABC News website"""
     
-    def parse(self, html_content: str) -> List[NewsItem]:
+    site_name = "ABC News"
+    
+    def __init__(self):
+        super().__init__()
+        self._news_xp = _xpath(f"//div[@data-id='103068804'][{_has_class('GenericCard_card__oqpe3')}]")
+        # Trailing [1] lets libxml2 stop at the first match inside each card
+        self._title_xp = _xpath(f"(.//a[{_has_class('GenericCard_link__EMXqX')}])[1]")
+        self._desc_xp = _xpath("(.//div[normalize-space(@class)='Typography_base__sj2RP GenericCard_synopsis__mgnzs'])[1]")
+        self._time_xp = _xpath("(.//time[normalize-space(@class)='Typography_base__sj2RP DynamicTimestamp_printDate__OVPa2'])[1]")
+    
+    def parse(self, html_content: bytes) -> List[NewsItem]:
         news_items = []
         try:
-            soup = BeautifulSoup(html_content, features="html.parser")
-            website_name = self._get_site_name(soup)
+            root = lxml_html.document_fromstring(html_content, parser=self._html_parser)
+            website_name = self.site_name
             
-            selector = 'div[data-id="103068804"].GenericCard_card__oqpe3'
-            for news in soup.select(selector):
-                try:
-                    title_elem = news.find('a', class_="GenericCard_link__EMXqX")
-                    desc_elem = news.find('div', class_="Typography_base__sj2RP GenericCard_synopsis__mgnzs")
-                    time_elem = news.find('time', class_="Typography_base__sj2RP DynamicTimestamp_printDate__OVPa2")
-                    
-                    # Use safe extraction methods - fixes Issue #1
-                    title = self.safe_get_text(title_elem)
-                    desc = self.safe_get_text(desc_elem)
-                    timestamp = self.safe_get_text(time_elem)
-                    
-                    if title and desc and timestamp:
-                        news_items.append(NewsItem(website_name, title, desc, timestamp))
-                except Exception as e:
-                    logger.warning(f"Error parsing news item: {e}")
+            for news in self._news_xp(root):
+                title_elem = self.first(self._title_xp, news)
+                desc_elem = self.first(self._desc_xp, news)
+                time_elem = self.first(self._time_xp, news)
+                if title_elem is None or desc_elem is None or time_elem is None:
                     continue
+                
+                # Use safe extraction methods - fixes Issue #1
+                title = self.safe_get_text(title_elem)
+                desc = self.safe_get_text(desc_elem)
+                timestamp = self.safe_get_text(time_elem)
+                
+                if title and desc and timestamp:
+                    news_items.append(NewsItem(website_name, title, desc, timestamp))
         except Exception as e:
             logger.error(f"Error parsing ABC content: {e}")
         
         return news_items
+
+
+_PARSERS = {
+    "https://www.liputan6.com/": Liputan6Parser,
+    "https://www.bisnis.com/": BisnisParser,
+    "https://www.abc.net.au/news/indonesian": ABCParser,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_for(url: str) -> NewsParser:
+    """Return the single shared parser instance for a site"""
+    try:
+        return _PARSERS[url]()
+    except KeyError:
+        raise ValueError("Unsupported news site") from None
+
+
+def _parse_site(news_site: str, html_content: bytes) -> List[NewsItem]:
+    """Parse a page with the site's cached parser; runs in the worker pool"""
+    return _parser_for(news_site).parse(html_content)
+
+
+class ParserPool:
+    """Owns the parser worker pool and replaces it when a worker dies
+    
+    A ProcessPoolExecutor is unusable for good once any worker process exits
+    unexpectedly (OOM kill, crash in libxml2), so it is rebuilt on demand.
+    """
     
-    def _get_site_name(self, soup) -> str:
+    def __init__(self, executor_factory: Optional[Callable[[], concurrent.futures.Executor]] = None):
+        self.executor_factory = executor_factory or functools.partial(
+            concurrent.futures.ProcessPoolExecutor, max_workers=os.cpu_count()
+        )
+        self.executor = self.executor_factory()
+    
+    async def parse(self, news_site: str, html_content: bytes) -> List[NewsItem]:
+        """Parse a page in the pool, retrying once on a fresh pool if it is broken"""
+        loop = asyncio.get_running_loop()
+        executor = self.executor
         try:
-            if soup.head and soup.head.find('title'):
-                return soup.head.find('title').string or "ABC News"
-        except:
-            pass
-        return "ABC News"
+            return await loop.run_in_executor(executor, _parse_site, news_site, html_content)
+        except BrokenProcessPool as e:
+            logger.warning(f"Parser pool broken ({e}); starting a new one")
+            # Another scraper may already have replaced it
+            if self.executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = self.executor_factory()
+            return await loop.run_in_executor(self.executor, _parse_site, news_site, html_content)
+    
+    def shutdown(self):
+        """Stop the worker processes"""
+        self.executor.shutdown(cancel_futures=True)
 
 
 class NewsScraping:
     """Main scraper class - fixes Issue #2 (separation of concerns)"""
     
-    def __init__(self, news_site: str, interval: int):
+    parse_cache_size = 4
+    
+    def __init__(self, news_site: str, interval: int,
+                 news_queue: Optional[asyncio.Queue] = None,
+                 http_client: Optional[HTTPClient] = None,
+                 parser_pool: Optional[ParserPool] = None):
         # Input validation - fixes Issue #8
         if not news_site or interval <= 0:
             raise ValueError("Invalid parameters")
         
         self.news_site = news_site
         self.interval = interval
-        self.news_queue = Queue()
-        self.stop_event = threading.Event()
+        # Scrapers usually share one queue so the aggregator can block on it
+        self.news_queue = news_queue if news_queue is not None else asyncio.Queue()
+        
+        # Parsers live in the worker processes (see _parser_for); only validate here,
+        # before an unsupported site can open a session
+        if news_site not in _PARSERS:
+            raise ValueError("Unsupported news site")
         
         # Separate HTTP client - fixes Issue #2, #4
-        self.http_client = HTTPClient()
+        # Usually shared by all scrapers; whoever creates it closes it
+        self.http_client = http_client if http_client is not None else HTTPClient()
         
-        # Use factory pattern for parsers - fixes Issue #3
-        self.parser = self._create_parser()
-        self.thread = None
-    
-    def _create_parser(self) -> NewsParser:
-        """Factory method for creating parsers - fixes Issue #3"""
-        if self.news_site == "https://www.liputan6.com/":
-            return Liputan6Parser()
-        elif self.news_site == "https://www.bisnis.com/":
-            return BisnisParser()
-        elif self.news_site == "https://www.abc.net.au/news/indonesian":
-            return ABCParser()
-        else:
-            raise ValueError("Unsupported news site")
+        # Parsing is CPU-bound; None falls back to the loop's default thread pool
+        self.parser_pool = parser_pool
+        # Digest of recent page bodies -> parsed items, for 200s with unchanged content
+        self._parse_cache = collections.OrderedDict()
     
-    def fetch(self) -> Optional[str]:
+    async def fetch(self) -> Union[bytearray, _NotModified, None]:
         """Fetch content using HTTP client"""
-        return self.http_client.fetch(self.news_site)
+        return await self.http_client.fetch(self.news_site)
     
-    def scrape_news(self):
-        """Main scraping loop with better error handling - fixes Issue #7"""
-        while not self.stop_event.is_set():
+    async def _parse(self, html_content: bytes) -> List[NewsItem]:
+        """Parse off the event loop, in the worker pool when one is set"""
+        if self.parser_pool is not None:
+            return await self.parser_pool.parse(self.news_site, html_content)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _parse_site, self.news_site, html_content
+        )
+    
+    async def scrape_news(self):
+        """Main scraping loop with better error handling - fixes Issue #7
+        
+        Runs until its task is cancelled; every await is a cancellation point.
+        """
+        while True:
             try:
-                html_content = self.fetch()
-                if html_content:
-                    news_data = self.parser.parse(html_content)
+                html_content = await self.fetch()
+                # An unchanged page has nothing new to parse
+                if html_content is not NOT_MODIFIED and html_content:
+                    page_key = hashlib.blake2b(html_content, digest_size=16).digest()
+                    news_data = self._parse_cache.get(page_key)
+                    if news_data is None:
+                        try:
+                            news_data = await self._parse(html_content)
+                        except Exception:
+                            # Otherwise the next poll gets a 304 and this version is never parsed
+                            self.http_client.forget(self.news_site)
+                            raise
+                        self._parse_cache[page_key] = news_data
+                        if len(self._parse_cache) > self.parse_cache_size:
+                            self._parse_cache.popitem(last=False)
+                    else:
+                        self._parse_cache.move_to_end(page_key)
                     for news_item in news_data:
-                        if not self.stop_event.is_set():
-                            self.news_queue.put(news_item)
+                        self.news_queue.put_nowait(news_item)
                 
-                # Interruptible sleep - fixes Issue #6
-                for _ in range(self.interval):
-                    if self.stop_event.is_set():
-                        break
-                    time.sleep(1)
+                # Cancellable sleep - fixes Issue #6
+                await asyncio.sleep(self.interval)
                     
             except Exception as e:
                 logger.error(f"Error scraping {self.news_site}: {e}")
-                time.sleep(5)  # Wait before retry
-    
-    def start_thread(self):
-        """Start scraping thread"""
-        if self.thread and self.thread.is_alive():
-            logger.warning("Thread already running")
-            return
-        
-        self.stop_event.clear()
-        self.thread = threading.Thread(target=self.scrape_news, daemon=True)
-        self.thread.start()
-        logger.info(f"Started thread for {self.news_site}")
-    
-    def stop_thread(self):
-        """Stop scraping thread properly - fixes Issue #6"""
-        self.stop_event.set()
-        if self.thread:
-            self.thread.join(timeout=5)
-            if self.thread.is_alive():
-                logger.warning("Thread did not stop gracefully")
-        logger.info(f"Stopped thread for {self.news_site}")
-
-
-def main_thread(news_scrapers):
+                await asyncio.sleep(5)  # Wait before retry
+
+
+async def aggregate_news(news_queue: asyncio.Queue):
     """Main aggregation function"""
     seen_news = set()
     
+    while True:
+        # Wakes as soon as any scraper queues an item
+        batch = [await news_queue.get()]
+        # Drain whatever else is already queued into the same write
+        while not news_queue.empty():
+            batch.append(news_queue.get_nowait())
+        
+        output = []
+        for news in batch:
+            # Keep a fixed-size digest instead of the full strings
+            news_key = hashlib.blake2b(
+                f"{news.name}\0{news.title}\0{news.desc}\0{news.timestamp}".encode(),
+                digest_size=16
+            ).digest()
+            
+            if news_key not in seen_news:
+                output.append(
+                    f"Website Name: {news.name}\n"
+                    f"News Title: {news.title}\n"
+                    f"Description: {news.desc}\n"
+                    f"Time Posted: {news.timestamp}\n"
+                    f"{'=' * 50}\n"
+                )
+                seen_news.add(news_key)
+        
+        if output:
+            sys.stdout.write("".join(output))
+            sys.stdout.flush()
+
+
+async def main(configs):
+    """Create scrapers and run them alongside the aggregator"""
+    # Create scrapers with error handling
+    scrapers = []
+    news_queue = asyncio.Queue()
+    # One connection pool and TLS context for every site
+    http_client = HTTPClient()
+    # Worker processes parse pages in parallel, outside the GIL
+    parser_pool = ParserPool()
+    
     try:
-        while not all(scraper.stop_event.is_set() for scraper in news_scrapers):
-            for scraper in news_scrapers:
-                while not scraper.news_queue.empty():
-                    try:
-                        news = scraper.news_queue.get_nowait()
-                        news_tuple = (news.name, news.title, news.desc, news.timestamp)
-                        
-                        if news_tuple not in seen_news:
-                            print(f"Website Name: {news.name}")
-                            print(f"News Title: {news.title}")
-                            print(f"Description: {news.desc}")
-                            print(f"Time Posted: {news.timestamp}")
-                            print("=" * 50)
-                            seen_news.add(news_tuple)
-                    except:
-                        break
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Received interrupt signal")
+        for url, interval in configs:
+            try:
+                scrapers.append(NewsScraping(url, interval, news_queue, http_client, parser_pool))
+                logger.info(f"Started scraper for {url}")
+            except Exception as e:
+                logger.error(f"Failed to create scraper for {url}: {e}")
+        
+        if not scrapers:
+            return
+        
+        await asyncio.gather(
+            aggregate_news(news_queue),
+            *(scraper.scrape_news() for scraper in scrapers)
+        )
     finally:
         # Proper cleanup - fixes Issue #6
-        for scraper in news_scrapers:
-            scraper.stop_thread()
-            scraper.http_client.close()
+        await http_client.close()
+        parser_pool.shutdown()
+        for scraper in scrapers:
+            logger.info(f"Stopped scraper for {scraper.news_site}")
 
 
 if __name__ == '__main__':
-    # Create scrapers with error handling
-    scrapers = []
-    
     configs = [
         ("https://www.liputan6.com/", 3600),
         ("https://www.bisnis.com/", 1800),
         ("https://www.abc.net.au/news/indonesian", 900)
     ]
     
-    for url, interval in configs:
-        try:
-            scraper = NewsScraping(url, interval)
-            scrapers.append(scraper)
-            scraper.start_thread()
-        except Exception as e:
-            logger.error(f"Failed to create scraper for {url}: {e}")
-    
-    # Setup signal handler for graceful shutdown - fixes Issue #6
-    def signal_handler(signum, frame):
+    # Ctrl+C cancels every task, which runs the cleanup in main() - fixes Issue #6
+    try:
+        asyncio.run(main(configs))
+    except KeyboardInterrupt:
         logger.info("Shutting down...")
-        for scraper in scrapers:
-            scraper.stop_thread()
-        exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Run main loop
-    if scrapers:
-        main_thread(scrapers) 
\ No newline at end of file
@@ -0,0 +1,533 @@
+import unittest
+import sys
+import os
+import pickle
+import asyncio
+import concurrent.futures
+import functools
+import signal
+import gzip
+import importlib.util
+import httpx
+from unittest.mock import AsyncMock, patch
+
+# Add path to the tested module
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from programminglanguage2023_refactored import (
+    NOT_MODIFIED, HTTPClient, NewsItem, NewsScraping, ParserPool, Liputan6Parser, BisnisParser, ABCParser,
+    aggregate_news
+)
+
+LIPUTAN6_URL = "https://www.liputan6.com/"
+LIPUTAN6_PAGE = b"""
+<html>
+    <body>
+        <div class="headline--main__wrapper">
+            <h1 class="headline--main__title">Title</h1>
+            <p class="headline--main__short-desc">Description</p>
+            <time class="timeago" datetime="2023-01-01">Time</time>
+        </div>
+    </body>
+</html>
+"""
+
+
+class CountingExecutor(concurrent.futures.Executor):
+    """Runs submitted calls inline and counts them"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls += 1
+        future = concurrent.futures.Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class FailingExecutor(concurrent.futures.Executor):
+    """Fails every submitted call with the given exception"""
+
+    def __init__(self, error):
+        self.error = error
+
+    def submit(self, fn, *args, **kwargs):
+        future = concurrent.futures.Future()
+        future.set_exception(self.error)
+        return future
+
+
+class StubHTTPClient:
+    """Returns canned fetch results, then cancels the scraping loop"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.forgotten = []
+
+    async def fetch(self, url):
+        if not self.results:
+            raise asyncio.CancelledError
+        return self.results.pop(0)
+
+    def forget(self, url):
+        self.forgotten.append(url)
+
+
+class RecordingStream:
+    """Stands in for sys.stdout and keeps every write() call separately"""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+
+    def flush(self):
+        pass
+
+
+async def run_scraper(results, parser_pool):
+    """Run scrape_news over the canned results and return the queued items"""
+    scraper = NewsScraping(LIPUTAN6_URL, 1, http_client=StubHTTPClient(results), parser_pool=parser_pool)
+    scraper.interval = 0  # no real waiting between canned fetches
+    try:
+        await scraper.scrape_news()
+    except asyncio.CancelledError:
+        pass
+    items = []
+    while not scraper.news_queue.empty():
+        items.append(scraper.news_queue.get_nowait())
+    return scraper, items
+
+
+class TestNewsItem(unittest.TestCase):
+    """Tests for NewsItem construction and pickling"""
+
+    def test_pickle_round_trip_keeps_fields_and_interns_name(self):
+        # Built at runtime so the name is not already an interned literal
+        item = NewsItem("".join(["Lipu", "tan6"]), "Title", "Description", "2023-01-01")
+
+        restored = pickle.loads(pickle.dumps(item))
+
+        self.assertEqual(
+            (restored.name, restored.title, restored.desc, restored.timestamp),
+            ("Liputan6", "Title", "Description", "2023-01-01")
+        )
+        self.assertIs(restored.name, sys.intern(restored.name))
+
+    def test_empty_field_rejected(self):
+        with self.assertRaises(ValueError):
+            NewsItem("Liputan6", "", "Description", "2023-01-01")
+
+
+class TestLiputan6Parser(unittest.TestCase):
+    """Fixture-HTML tests for the lxml/XPath Liputan6 parser"""
+
+    def setUp(self):
+        self.parser = Liputan6Parser()
+
+    def test_valid_item(self):
+        html_content = b"""
+        <html>
+            <head><title>Liputan6 Test</title></head>
+            <body>
+                <!-- comments are dropped by the parser -->
+                <div class="row headline--main__wrapper">
+                    <h1 class="headline--main__title"> Hello <b>World</b></h1>
+                    <p class="headline--main__short-desc">Test Description</p>
+                    <time class="timeago" datetime="2023-01-01T12:00:00">Time</time>
+                </div>
+            </body>
+        </html>
+        """
+
+        result = self.parser.parse(html_content)
+        self.assertEqual(len(result), 1)
+        # Text nodes are stripped and joined like bs4's get_text(strip=True)
+        # The constant site name is used, not the page <title>
+        self.assertEqual(result[0].name, "Liputan6")
+        self.assertEqual(result[0].title, "HelloWorld")
+        self.assertEqual(result[0].desc, "Test Description")
+        self.assertEqual(result[0].timestamp, "2023-01-01T12:00:00")
+
+    def test_missing_element_skips_item(self):
+        html_content = b"""
+        <html>
+            <body>
+                <div class="headline--main__wrapper">
+                    <p class="headline--main__short-desc">Description</p>
+                    <time class="timeago" datetime="2023-01-01">Time</time>
+                </div>
+                <div class="headline--main__wrapper">
+                    <h1 class="headline--main__title">Kept</h1>
+                    <p class="headline--main__short-desc">Description</p>
+                    <time class="timeago" datetime="2023-01-01">Time</time>
+                </div>
+            </body>
+        </html>
+        """
+
+        result = self.parser.parse(html_content)
+        self.assertEqual([item.title for item in result], ["Kept"])
+
+    def test_first_match_only(self):
+        html_content = b"""
+        <html>
+            <body>
+                <div class="headline--main__wrapper">
+                    <h1 class="headline--main__title">First</h1>
+                    <h1 class="headline--main__title">Second</h1>
+                    <p class="headline--main__short-desc">Description</p>
+                    <time class="timeago" datetime="2023-01-01">Time</time>
+                </div>
+            </body>
+        </html>
+        """
+
+        result = self.parser.parse(html_content)
+        self.assertEqual(result[0].title, "First")
+
+    def test_empty_html(self):
+        self.assertEqual(self.parser.parse(b"<html></html>"), [])
+
+
+class TestBisnisParser(unittest.TestCase):
+    """Fixture-HTML tests for the lxml/XPath Bisnis parser"""
+
+    def setUp(self):
+        self.parser = BisnisParser()
+
+    def test_valid_item(self):
+        html_content = b"""
+        <html>
+            <head><title>Bisnis Test</title></head>
+            <body>
+                <ul>
+                    <li class="big style2">
+                        <div class="channel"><div class="date">2023-01-01</div></div>
+                        <h2><a class="bigteks" title="Test Title">Title</a></h2>
+                        <div class="description">Description</div>
+                    </li>
+                </ul>
+            </body>
+        </html>
+        """
+
+        result = self.parser.parse(html_content)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].name, "Bisnis")
+        self.assertEqual(result[0].title, "Test Title")
+        self.assertEqual(result[0].desc, "Description")
+        self.assertEqual(result[0].timestamp, "2023-01-01")
+
+    def test_missing_nested_element_skips_item(self):
+        html_content = b"""
+        <html>
+            <body>
+                <ul>
+                    <li class="big style2">
+                        <div class="channel"></div>
+                        <h2><a class="bigteks" title="Test Title">Title</a></h2>
+                        <div class="description">Description</div>
+                    </li>
+                </ul>
+            </body>
+        </html>
+        """
+
+        self.assertEqual(self.parser.parse(html_content), [])
+
+    def test_multi_word_class_ignores_extra_whitespace(self):
+        # bs4 splits class on whitespace, so " big  style2 " still matches "big style2"
+        html_content = b"""
+        <html>
+            <body>
+                <ul>
+                    <li class=" big  style2 ">
+                        <div class="channel"><div class="date">2023-01-01</div></div>
+                        <h2><a class="bigteks" title="Test Title">Title</a></h2>
+                        <div class="description">Description</div>
+                    </li>
+                </ul>
+            </body>
+        </html>
+        """
+
+        self.assertEqual(len(self.parser.parse(html_content)), 1)
+
+    def test_multi_word_class_needs_exact_attribute(self):
+        # Like bs4's class_="big style2", the whole attribute string must match
+        html_content = b"""
+        <html>
+            <body>
+                <ul>
+                    <li class="style2 big">
+                        <div class="channel"><div class="date">2023-01-01</div></div>
+                        <h2><a class="bigteks" title="Test Title">Title</a></h2>
+                        <div class="description">Description</div>
+                    </li>
+                </ul>
+            </body>
+        </html>
+        """
+
+        self.assertEqual(self.parser.parse(html_content), [])
+
+
+class TestABCParser(unittest.TestCase):
+    """Fixture-HTML tests for the lxml/XPath ABC News parser"""
+
+    def setUp(self):
+        self.parser = ABCParser()
+
+    def test_valid_item(self):
+        html_content = b"""
+        <html>
+            <head><title>ABC Test</title></head>
+            <body>
+                <div data-id="103068804" class="GenericCard_card__oqpe3 extra">
+                    <a class="GenericCard_link__EMXqX" href="#">Test Title</a>
+                    <div class="Typography_base__sj2RP  GenericCard_synopsis__mgnzs">Description</div>
+                    <time class=" Typography_base__sj2RP DynamicTimestamp_printDate__OVPa2">1 hour ago</time>
+                </div>
+            </body>
+        </html>
+        """
+
+        result = self.parser.parse(html_content)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].name, "ABC News")
+        self.assertEqual(result[0].title, "Test Title")
+        self.assertEqual(result[0].desc, "Description")
+        self.assertEqual(result[0].timestamp, "1 hour ago")
+
+    def test_missing_element_skips_item(self):
+        html_content = b"""
+        <html>
+            <body>
+                <div data-id="103068804" class="GenericCard_card__oqpe3">
+                    <a class="GenericCard_link__EMXqX" href="#">Test Title</a>
+                    <div class="Typography_base__sj2RP GenericCard_synopsis__mgnzs">Description</div>
+                </div>
+            </body>
+        </html>
+        """
+
+        self.assertEqual(self.parser.parse(html_content), [])
+
+    def test_other_data_id_ignored(self):
+        html_content = b"""
+        <html>
+            <body>
+                <div data-id="1" class="GenericCard_card__oqpe3">
+                    <a class="GenericCard_link__EMXqX" href="#">Test Title</a>
+                    <div class="Typography_base__sj2RP GenericCard_synopsis__mgnzs">Description</div>
+                    <time class="Typography_base__sj2RP DynamicTimestamp_printDate__OVPa2">now</time>
+                </div>
+            </body>
+        </html>
+        """
+
+        self.assertEqual(self.parser.parse(html_content), [])
+
+
+class TestHTTPClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for HTTPClient.fetch against an httpx.MockTransport"""
+
+    async def fetch_with(self, handler, url="https://www.abc.net.au/news/indonesian"):
+        client = HTTPClient(max_retries=1, transport=httpx.MockTransport(handler))
+        try:
+            return await client.fetch(url)
+        finally:
+            await client.close()
+
+    async def test_follows_redirects(self):
+        def handler(request):
+            if request.url.path == "/news/indonesian":
+                return httpx.Response(301, headers={"Location": "https://www.abc.net.au/indonesian/"})
+            return httpx.Response(200, content=b"<html>moved</html>")
+
+        result = await self.fetch_with(handler)
+        self.assertEqual(bytes(result), b"<html>moved</html>")
+
+    async def test_accept_encoding_lists_only_decodable_codecs(self):
+        sent = {}
+
+        def handler(request):
+            sent["accept-encoding"] = request.headers["Accept-Encoding"]
+            return httpx.Response(
+                200,
+                content=gzip.compress(b"<html>compressed</html>"),
+                headers={"Content-Encoding": "gzip"}
+            )
+
+        result = await self.fetch_with(handler)
+        self.assertEqual(bytes(result), b"<html>compressed</html>")
+
+        encodings = [encoding.strip() for encoding in sent["accept-encoding"].split(",")]
+        self.assertIn("gzip", encodings)
+        brotli_available = any(
+            importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi")
+        )
+        self.assertEqual("br" in encodings, brotli_available)
+
+    async def test_conditional_get_round_trip(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content=b"<html>page</html>",
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+            )
+
+        client = HTTPClient(max_retries=1, transport=httpx.MockTransport(handler))
+        try:
+            first = await client.fetch(LIPUTAN6_URL)
+            second = await client.fetch(LIPUTAN6_URL)
+            client.forget(LIPUTAN6_URL)
+            third = await client.fetch(LIPUTAN6_URL)
+        finally:
+            await client.close()
+
+        self.assertEqual(bytes(first), b"<html>page</html>")
+        self.assertIs(second, NOT_MODIFIED)
+        self.assertNotIn("If-None-Match", requests_seen[0].headers)
+        self.assertEqual(requests_seen[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(requests_seen[1].headers["If-Modified-Since"], "Wed, 21 Oct 2015 07:28:00 GMT")
+        # forget() makes the next fetch unconditional again
+        self.assertEqual(bytes(third), b"<html>page</html>")
+        self.assertNotIn("If-None-Match", requests_seen[2].headers)
+        self.assertNotIn("If-Modified-Since", requests_seen[2].headers)
+
+    async def test_server_error_returns_none(self):
+        result = await self.fetch_with(lambda request: httpx.Response(500))
+        self.assertIsNone(result)
+
+
+class TestScrapeNews(unittest.IsolatedAsyncioTestCase):
+    """Tests for the NewsScraping.scrape_news loop with stubbed I/O"""
+
+    async def test_not_modified_skips_parse(self):
+        pool = ParserPool(CountingExecutor)
+        _, items = await run_scraper([bytearray(LIPUTAN6_PAGE), NOT_MODIFIED], pool)
+
+        self.assertEqual(pool.executor.calls, 1)
+        self.assertEqual(len(items), 1)
+
+    async def test_identical_page_reuses_parsed_items(self):
+        pool = ParserPool(CountingExecutor)
+        _, items = await run_scraper([bytearray(LIPUTAN6_PAGE), bytearray(LIPUTAN6_PAGE)], pool)
+
+        self.assertEqual(pool.executor.calls, 1)
+        self.assertEqual(len(items), 2)
+
+    async def test_parse_cache_is_bounded(self):
+        pool = ParserPool(CountingExecutor)
+        size = NewsScraping.parse_cache_size
+        pages = [LIPUTAN6_PAGE.replace(b"Title", b"Title %d" % i) for i in range(size + 1)]
+        # The first page is evicted by the last distinct one, so it is parsed again
+        results = [bytearray(page) for page in pages] + [bytearray(pages[0])]
+
+        scraper, items = await run_scraper(results, pool)
+
+        self.assertEqual(pool.executor.calls, size + 2)
+        self.assertEqual(len(scraper._parse_cache), size)
+        self.assertEqual(len(items), size + 2)
+
+    async def test_parses_in_real_process_pool(self):
+        pool = ParserPool(functools.partial(concurrent.futures.ProcessPoolExecutor, max_workers=1))
+        try:
+            _, items = await run_scraper([bytearray(LIPUTAN6_PAGE)], pool)
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0].name, "Liputan6")
+        self.assertEqual(items[0].title, "Title")
+        self.assertEqual(items[0].desc, "Description")
+        self.assertEqual(items[0].timestamp, "2023-01-01")
+        # Rebuilt through NewsItem.__init__ on this side of the pool
+        self.assertIs(items[0].name, sys.intern(items[0].name))
+
+    async def test_dead_worker_replaces_pool(self):
+        pool = ParserPool(functools.partial(concurrent.futures.ProcessPoolExecutor, max_workers=1))
+        broken = pool.executor
+        try:
+            worker_pid = broken.submit(os.getpid).result()
+            os.kill(worker_pid, signal.SIGKILL)
+            with self.assertLogs("programminglanguage2023_refactored", "WARNING"):
+                _, items = await run_scraper([bytearray(LIPUTAN6_PAGE)], pool)
+        finally:
+            pool.shutdown()
+
+        self.assertIsNot(pool.executor, broken)
+        self.assertEqual([item.title for item in items], ["Title"])
+
+    async def test_failed_parse_forgets_validators(self):
+        pool = ParserPool(lambda: FailingExecutor(RuntimeError("parse failed")))
+        scraper = NewsScraping(LIPUTAN6_URL, 1, http_client=StubHTTPClient([bytearray(LIPUTAN6_PAGE)]),
+                               parser_pool=pool)
+
+        # Skip the 5-second retry wait after the failed cycle
+        with patch("asyncio.sleep", AsyncMock()), self.assertLogs("programminglanguage2023_refactored"):
+            with self.assertRaises(asyncio.CancelledError):
+                await scraper.scrape_news()
+
+        self.assertEqual(scraper.http_client.forgotten, [LIPUTAN6_URL])
+        self.assertTrue(scraper.news_queue.empty())
+
+
+class TestAggregateNews(unittest.IsolatedAsyncioTestCase):
+    """Tests for aggregate_news reading the shared queue"""
+
+    def block(self, item):
+        return (
+            f"Website Name: {item.name}\n"
+            f"News Title: {item.title}\n"
+            f"Description: {item.desc}\n"
+            f"Time Posted: {item.timestamp}\n"
+            f"{'=' * 50}\n"
+        )
+
+    async def drain(self, queue, stream, writes):
+        """Let the aggregator run until the queue is empty and `writes` calls were made"""
+        for _ in range(100):
+            if queue.empty() and len(stream.writes) >= writes:
+                return
+            await asyncio.sleep(0)
+        self.fail("aggregate_news did not drain the queue")
+
+    async def test_dedups_and_writes_once_per_batch(self):
+        first = NewsItem("Liputan6", "Title A", "Desc A", "2023-01-01")
+        second = NewsItem("Bisnis", "Title B", "Desc B", "2023-01-02")
+        third = NewsItem("ABC News", "Title C", "Desc C", "2023-01-03")
+        queue = asyncio.Queue()
+        stream = RecordingStream()
+
+        with patch("sys.stdout", stream):
+            for item in (first, NewsItem("Liputan6", "Title A", "Desc A", "2023-01-01"), second):
+                queue.put_nowait(item)
+            task = asyncio.create_task(aggregate_news(queue))
+            try:
+                await self.drain(queue, stream, 1)
+                # Second batch: a repeat from the first batch plus one new item
+                queue.put_nowait(second)
+                queue.put_nowait(third)
+                await self.drain(queue, stream, 2)
+            finally:
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+        self.assertEqual(stream.writes, [
+            self.block(first) + self.block(second),
+            self.block(third),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)